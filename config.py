@@ -2,30 +2,68 @@
 Конфигурация тестов с реалистичными данными
 """
 import os
+from functools import cache, lru_cache
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
-load_dotenv()
+
+def _readonly(mapping):
+    """Рекурсивно оборачивает конфигурационный словарь в MappingProxyType
+
+    Конфигурация только читается, поэтому отдаем тесты по ссылке без
+    защитных копий.
+    """
+    return MappingProxyType({
+        key: _readonly(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
 
 # URL приложения
 BASE_URL = "https://app.evgenybelkin.ru/"
 LOGIN_URL = f"{BASE_URL}site/login"
 SERVICES_URL = BASE_URL
 
-# Данные для авторизации (из .env)
-UI_CREDENTIALS = {
-    "username": os.environ.get("UI_USERNAME", ""),
-    "password": os.environ.get("UI_PASSWORD", ""),
-}
+# Данные для авторизации (из .env) — читаем лениво при первом обращении,
+# чтобы сбор тестов не платил за чтение .env, когда данные не нужны
+@cache
+def _env():
+    """Читаем все нужные переменные среды одним проходом
+
+    Если переменные уже заданы в окружении (например, воркеры pytest-xdist
+    наследуют их от контроллера), файл .env не перечитываем.
+    """
+    if not os.environ.get("UI_USERNAME"):
+        load_dotenv()
+    return {
+        key: os.environ.get(key, "")
+        for key in ("UI_USERNAME", "UI_PASSWORD", "API_TOKEN")
+    }
+
+
+@cache
+def get_ui_credentials():
+    """Данные для входа в UI (из .env)"""
+    return _readonly({
+        "username": _env()["UI_USERNAME"],
+        "password": _env()["UI_PASSWORD"],
+    })
+
+
 # API данные
 API_URL = f"{BASE_URL}api/service/"
-API_HEADERS = {
-    "Authorization": f"Bearer {os.environ.get('API_TOKEN', '')}",
-    "Content-Type": "application/json",
-    "Accept": "application/json",
-}
 
-DB_LIMITS = {
+
+@cache
+def get_api_headers():
+    """Заголовки для запросов к API (токен из .env)"""
+    return _readonly({
+        "Authorization": f"Bearer {_env()['API_TOKEN']}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    })
+
+DB_LIMITS = _readonly({
     "name_max_length": 255,
     "min_int": -2147483648,
     "max_int": 2147483647,
@@ -35,7 +73,7 @@ DB_LIMITS = {
     "quantity_min": 1,
     "tax_min": 0.01,
     "gross_min": 0.01
-}
+})
 
 REALISTIC_DATA = {
     "services": [
@@ -66,7 +104,7 @@ REALISTIC_DATA = {
     ]
 }
 # Селекторы
-UI_SELECTORS = {
+UI_SELECTORS = _readonly({
     "login": {
         "username": "#loginform-username",
         "password": "#loginform-password",
@@ -91,16 +129,51 @@ UI_SELECTORS = {
         "tax_badge": ".badge.bg-secondary",
         "gross_badge": ".badge.bg-success"
     }
-}
+})
 # Формулы расчета
 
 
+# Ставка НДС в процентах — для целочисленной арифметики в копейках
+_TAX_RATE_PERCENT = round(DB_LIMITS["tax_rate"] * 100)
+
+
+def _tax_cents(price):
+    """НДС в целых копейках: без плавающей точки до финального деления"""
+    cents = round(price * 100)
+    return (cents * _TAX_RATE_PERCENT + 50) // 100
+
+
+@lru_cache(maxsize=2048)
 def calculate_tax(price):
     """Расчет НДС по ставке 22%"""
-    return round(price * DB_LIMITS["tax_rate"], 2)
+    return _tax_cents(price) / 100
 
 
+@lru_cache(maxsize=2048)
 def calculate_gross(price):
     """Расчет суммы с НДС"""
-    tax = calculate_tax(price)
-    return round(price + tax, 2)
+    return (round(price * 100) + _tax_cents(price)) / 100
+
+
+# Ожидаемые НДС и итог считаем один раз при импорте — список услуг
+# статический, пересчитывать значения в каждом тесте незачем
+for _service in REALISTIC_DATA["services"]:
+    _service["expected_tax"] = calculate_tax(_service["price"])
+    _service["expected_gross"] = calculate_gross(_service["price"])
+del _service
+
+# После предрасчета замораживаем тестовые данные целиком
+REALISTIC_DATA = MappingProxyType({
+    "services": tuple(_readonly(s) for s in REALISTIC_DATA["services"]),
+    "scenarios": tuple(_readonly(s) for s in REALISTIC_DATA["scenarios"]),
+})
+
+def iter_services(predicate=None):
+    """Лениво отдаем услуги из REALISTIC_DATA, по желанию с фильтром
+
+    Тесту, которому нужна пара записей, не приходится материализовывать
+    весь набор целиком.
+    """
+    for service in REALISTIC_DATA["services"]:
+        if predicate is None or predicate(service):
+            yield service
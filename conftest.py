@@ -1,9 +1,67 @@
 """
 Фикстуры для pytest + Playwright
 """
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from weakref import WeakKeyDictionary
+
+import httpx
 import pytest
-from playwright.sync_api import Page, Browser, BrowserContext, Playwright
-from config import LOGIN_URL, UI_CREDENTIALS, UI_SELECTORS
+from dotenv import load_dotenv
+from playwright.sync_api import (
+    Page,
+    Browser,
+    BrowserContext,
+    Playwright,
+    TimeoutError as PlaywrightTimeoutError,
+)
+from config import (
+    BASE_URL,
+    LOGIN_URL,
+    SERVICES_URL,
+    UI_SELECTORS,
+    get_api_headers,
+    get_ui_credentials,
+)
+
+
+def pytest_configure(config):
+    """Прогреваем .env один раз в контроллере
+
+    Воркеры pytest-xdist наследуют os.environ от контроллера и благодаря
+    защите в config._env() не перечитывают файл сами.
+    """
+    if not os.environ.get("UI_USERNAME"):
+        load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def api_session() -> httpx.Client:
+    """Общий HTTP/2-клиент для API-тестов
+
+    HTTP/2 мультиплексирует параллельные запросы в одном TCP+TLS
+    соединении — конкурентные воркеры не упираются в лимит «один запрос
+    на соединение» HTTP/1.1. Ретраи транспорта переживают обрывы
+    соединения, таймауты заданы на уровне клиента.
+    """
+    # Пул и ретраи живут в транспорте: при явном transport клиентские
+    # параметры http2/limits не применяются
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+    client = httpx.Client(
+        headers=get_api_headers(),
+        timeout=httpx.Timeout(10.0, connect=3.05),
+        transport=transport,
+    )
+    yield client
+    client.close()
 
 
 @pytest.fixture(scope="session")
@@ -14,12 +72,61 @@ def playwright_instance() -> Playwright:
         yield playwright
 
 
+# Кэш Locator-объектов по страницам: один разбор CSS-селектора на страницу
+# вместо разбора при каждом обращении
+_PAGE_SELECTORS = WeakKeyDictionary()
+
+
+def selectors_for(page: Page) -> SimpleNamespace:
+    """Готовые Locator-объекты для всех селекторов из UI_SELECTORS
+
+    Строятся один раз на страницу, обращение — через атрибуты:
+    selectors_for(page).login.username.fill(...)
+    """
+    cached = _PAGE_SELECTORS.get(page)
+    if cached is None:
+        cached = SimpleNamespace(**{
+            group: SimpleNamespace(**{
+                name: page.locator(selector)
+                for name, selector in selectors.items()
+            })
+            for group, selectors in UI_SELECTORS.items()
+        })
+        _PAGE_SELECTORS[page] = cached
+    return cached
+
+
+# Headless по умолчанию (HEADLESS=0 — запуск с видимым окном для отладки)
+HEADLESS = os.environ.get("HEADLESS", "1") == "1"
+
+# Флаги Chromium, убирающие лишние накладные расходы при запуске в CI
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-popup-blocking",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+
 @pytest.fixture(scope="session")
-def browser(playwright_instance: Playwright) -> Browser:
+def browser(playwright_instance: Playwright, request) -> Browser:
     """Создаем браузер"""
-    browser = playwright_instance.chromium.launch(headless=False)
+    browser = playwright_instance.chromium.launch(
+        headless=HEADLESS, args=CHROMIUM_ARGS)
+    # Закрытие выполняет pytest_sessionfinish: при падении других фикстур
+    # teardown через yield может не выполниться и оставить процессы Chromium
+    request.config._pw_browser = browser
     yield browser
-    browser.close()
+
+
+def pytest_sessionfinish(session):
+    """Гарантированно закрываем браузер в конце сессии"""
+    browser = getattr(session.config, "_pw_browser", None)
+    if browser is not None and browser.is_connected():
+        browser.close()
 
 
 @pytest.fixture
@@ -38,32 +145,217 @@ def page(context: BrowserContext) -> Page:
     page.close()
 
 
-@pytest.fixture(scope="class")
-def class_context(browser: Browser) -> BrowserContext:
-    """Создаем контекст для класса (class scope)"""
+# Каталог с сохраненными storage_state: авторизация переживает перезапуск
+# pytest, повторные прогоны стартуют без единого похода на форму логина
+_AUTH_STATE_DIR = Path(".auth")
+
+
+def _auth_state_path() -> Path:
+    """Путь к storage_state, привязанный к текущим учетным данным
+
+    Хэш логина и пароля в имени файла инвалидирует сохраненную сессию
+    при смене учетных данных без ручной чистки каталога.
+    """
+    credentials = get_ui_credentials()
+    digest = hashlib.sha256(
+        f"{credentials['username']}:{credentials['password']}".encode()
+    ).hexdigest()[:16]
+    return _AUTH_STATE_DIR / f"state-{digest}.json"
+
+
+def _login_via_api(playwright: Playwright, state_file: Path) -> bool:
+    """Пытаемся получить сессионную куку HTTP-запросами, минуя UI-форму
+
+    Один GET за CSRF-токеном и один POST (~100 мс на пару) вместо
+    многосекундного входа через браузер. False означает «не вышло» —
+    вызывающий откатывается на вход через форму.
+    """
+    credentials = get_ui_credentials()
+    request_context = playwright.request.new_context(base_url=BASE_URL)
+    try:
+        login_page = request_context.get("site/login")
+        if not login_page.ok:
+            return False
+        form = {
+            "LoginForm[username]": credentials["username"],
+            "LoginForm[password]": credentials["password"],
+        }
+        # Yii отклоняет POST без CSRF-токена — забираем его со страницы
+        csrf = re.search(r'name="_csrf[^"]*"\s+value="([^"]+)"',
+                         login_page.text())
+        if csrf:
+            form["_csrf"] = csrf.group(1)
+        response = request_context.post("site/login", form=form)
+        # При неверных данных Yii заново отдает форму логина тем же URL
+        if not response.ok or "/site/login" in response.url:
+            return False
+        request_context.storage_state(path=state_file)
+        return True
+    finally:
+        request_context.dispose()
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser: Browser, playwright_instance: Playwright) -> str:
+    """Выполняем авторизацию один раз и сохраняем storage_state на диск
+
+    Сначала пробуем дешевый HTTP-вход, на браузерную форму откатываемся
+    только если он не сработал. Файл переиспользуется между запусками
+    pytest; если сохраненная кука протухла, authenticated_page уронит
+    тест и файл достаточно удалить.
+    """
+    state_file = _auth_state_path()
+    if state_file.exists():
+        return str(state_file)
+    _AUTH_STATE_DIR.mkdir(exist_ok=True)
+    if _login_via_api(playwright_instance, state_file):
+        return str(state_file)
     context = browser.new_context()
-    yield context
+    page = context.new_page()
+    credentials = get_ui_credentials()
+    page.goto(LOGIN_URL)
+    login = selectors_for(page).login
+    login.username.fill(credentials["username"])
+    login.password.fill(credentials["password"])
+    login.submit.click()
+    try:
+        page.wait_for_url(lambda url: "/site/login" not in url, timeout=10_000)
+    except PlaywrightTimeoutError:
+        pytest.fail("Авторизация не удалась")
+    context.storage_state(path=state_file)
     context.close()
+    return str(state_file)
 
 
-@pytest.fixture(scope="class")
-def class_page(class_context: BrowserContext) -> Page:
-    """Создаем страницу для класса (class scope)"""
-    page = class_context.new_page()
-    yield page
-    page.close()
+# Сколько тестов выполняется в одном BrowserContext до его пересоздания:
+# Playwright копит объекты Request/Response внутри соединения и освобождает
+# их только при закрытии контекста, поэтому ограничиваем время его жизни
+CONTEXT_ROTATE_EVERY = 25
+
+
+# Пул простаивающих контекстов по отпечатку storage_state: вместо создания
+# нового контекста на каждый класс переиспользуем освободившийся, поэтому
+# число созданных контекстов растет как O(воркеров), а не O(классов).
+# Вместе с контекстом храним счетчик уже обслуженных им тестов — лимит
+# ротации действует на все время жизни контекста, а не на один класс
+_CTX_POOL: dict[str, list[tuple[BrowserContext, int]]] = {}
+_CTX_POOL_LOCK = threading.Lock()
+
+# Тестам достаточно DOM-селекторов — картинки и шрифты не грузим
+# (BLOCK_STATIC=0 возвращает полную загрузку страницы)
+BLOCK_STATIC_RESOURCES = os.environ.get("BLOCK_STATIC", "1") == "1"
+_STATIC_RESOURCES = "**/*.{png,jpg,jpeg,gif,svg,webp,woff,woff2,ttf}"
+
+
+def _new_context(browser: Browser, storage_state=None) -> BrowserContext:
+    """Создаем контекст; статические ресурсы отрезаем на уровне контекста"""
+    context = browser.new_context(storage_state=storage_state)
+    if BLOCK_STATIC_RESOURCES:
+        context.route(_STATIC_RESOURCES, lambda route: route.abort())
+    return context
+
+
+def _acquire_context(browser: Browser, pool_key: str,
+                     storage_state) -> tuple[BrowserContext, int]:
+    """Берем контекст из пула (со счетчиком тестов) или создаем новый"""
+    with _CTX_POOL_LOCK:
+        idle = _CTX_POOL.get(pool_key)
+        if idle:
+            return idle.pop()
+    return _new_context(browser, storage_state), 0
+
+
+def _release_context(pool_key: str, context: BrowserContext,
+                     tests_served: int):
+    """Возвращаем контекст в пул вместе с накопленным счетчиком тестов"""
+    for page in context.pages:
+        page.close()
+    with _CTX_POOL_LOCK:
+        _CTX_POOL.setdefault(pool_key, []).append((context, tests_served))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_context_pool():
+    """Закрываем все контексты пула в конце сессии"""
+    yield
+    with _CTX_POOL_LOCK:
+        for contexts in _CTX_POOL.values():
+            for context, _ in contexts:
+                context.close()
+        _CTX_POOL.clear()
+
+
+class ContextRecycler:
+    """Обертка над BrowserContext с ротацией каждые N тестов
+
+    Сохраняет storage_state перед закрытием старого контекста, поэтому
+    авторизация переживает ротацию. Контексты берутся из общего пула и
+    возвращаются туда при освобождении.
+    """
+
+    def __init__(self, browser: Browser, storage_state,
+                 rotate_every: int = CONTEXT_ROTATE_EVERY):
+        self._browser = browser
+        self._storage_state = storage_state
+        self._pool_key = str(storage_state)
+        self._rotate_every = rotate_every
+        # Продолжаем счет с того места, где остановился предыдущий класс
+        self.context, self._tests_done = _acquire_context(
+            browser, self._pool_key, storage_state)
+        self.page = self.context.new_page()
+
+    def note_test_finished(self):
+        self._tests_done += 1
+
+    def rotate_if_needed(self):
+        if self._tests_done < self._rotate_every:
+            return
+        # Накопивший объекты контекст закрываем, а не возвращаем в пул
+        self._storage_state = self.context.storage_state()
+        self.context.close()
+        self.context = _new_context(
+            self._browser, storage_state=self._storage_state)
+        self.page = self.context.new_page()
+        self._tests_done = 0
+
+    def close(self):
+        _release_context(self._pool_key, self.context, self._tests_done)
 
 
 @pytest.fixture(scope="class")
+def class_context(browser: Browser, auth_state: str) -> ContextRecycler:
+    """Создаем контекст для класса (class scope) с готовой авторизацией"""
+    recycler = ContextRecycler(browser, auth_state)
+    yield recycler
+    recycler.close()
+
+
+@pytest.fixture
+def class_page(class_context: ContextRecycler) -> Page:
+    """Текущая страница класса (пересоздается при ротации контекста)"""
+    yield class_context.page
+
+
+@pytest.fixture
 def authenticated_page(class_page: Page) -> Page:
-    """Страница с выполненной авторизацией - один раз на класс"""
+    """Страница с выполненной авторизацией (через storage_state)"""
     page = class_page
-    page.goto(LOGIN_URL)
-    page.fill(UI_SELECTORS["login"]["username"], UI_CREDENTIALS["username"])
-    page.fill(UI_SELECTORS["login"]["password"], UI_CREDENTIALS["password"])
-    page.click(UI_SELECTORS["login"]["submit"])
-    page.wait_for_timeout(3000)
+    if page.url == "about:blank":
+        page.goto(SERVICES_URL)
     # Проверяем что авторизация прошла успешно
-    if page.url == LOGIN_URL:
+    if "/site/login" in page.url:
         pytest.fail("Авторизация не удалась")
     yield page
+
+
+@pytest.fixture(autouse=True)
+def _recycle_class_context(request):
+    """Ротация контекста класса после каждого теста"""
+    if "class_context" in request.fixturenames:
+        recycler = request.getfixturevalue("class_context")
+    else:
+        recycler = None
+    yield
+    if recycler is not None:
+        recycler.note_test_finished()
+        recycler.rotate_if_needed()